@@ -1,18 +1,46 @@
 """Rich-based terminal UI for displaying transcripts and menus."""
 
+import re
+import sys
 from datetime import datetime
 from typing import List, Optional
 
-from rich.console import Console
-from rich.markdown import Markdown
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.table import Table
+from rich.table import Column, Table
 from rich.text import Text
 
 from podcrack.models import Transcript
 
 console = Console()
 
+# Words shown per page of a transcript, and a pattern matching one whole page
+WORDS_PER_PAGE = 500
+_PAGE_RE = re.compile(rf"\s*(?:\S+\s*){{1,{WORDS_PER_PAGE}}}")
+
+# Column template for the transcript list; copied per render since Rich
+# columns accumulate their cells. Short fixed-format columns never wrap.
+_LIST_COLUMNS = (
+    Column("#", style="dim", width=4, no_wrap=True),
+    Column("Podcast", style="cyan", width=25),
+    Column("Episode", style="white", width=40),
+    Column("Date", style="green", width=12, no_wrap=True),
+    Column("Duration", style="yellow", width=10, no_wrap=True),
+)
+
+
+def _render_to_string(renderable) -> str:
+    """Render a Rich renderable to a string with its ANSI styling applied."""
+    with console.capture() as capture:
+        console.print(renderable)
+    return capture.get()
+
+
+def _write_rendered(renderable):
+    """Render a Rich renderable up front and emit it with a single write to stdout."""
+    sys.stdout.write(_render_to_string(renderable))
+    sys.stdout.flush()
+
 
 def print_banner():
     """Print the podcrack banner."""
@@ -37,12 +65,11 @@ def print_transcript_list(transcripts: List[Transcript], page: int = 1, per_page
     end_idx = min(start_idx + per_page, total)
     page_transcripts = transcripts[start_idx:end_idx]
 
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("#", style="dim", width=4)
-    table.add_column("Podcast", style="cyan", width=25)
-    table.add_column("Episode", style="white", width=40)
-    table.add_column("Date", style="green", width=12)
-    table.add_column("Duration", style="yellow", width=10)
+    table = Table(
+        *(column.copy() for column in _LIST_COLUMNS),
+        show_header=True,
+        header_style="bold magenta",
+    )
 
     for idx, transcript in enumerate(page_transcripts, start=start_idx + 1):
         podcast = transcript.podcast_name or "Unknown"
@@ -50,22 +77,25 @@ def print_transcript_list(transcripts: List[Transcript], page: int = 1, per_page
 
         if transcript.publish_date:
             date_str = transcript.publish_date.strftime("%Y-%m-%d")
-        else:
+        elif transcript.file_mtime is not None:
             try:
-                mtime = transcript.file_path.stat().st_mtime
-                date_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
-            except (OSError, ValueError):
+                date_str = datetime.fromtimestamp(transcript.file_mtime).strftime("%Y-%m-%d")
+            except (OSError, ValueError, OverflowError):
                 date_str = "Unknown"
+        else:
+            date_str = "Unknown"
 
         duration = transcript.duration_formatted
 
         table.add_row(str(idx), podcast, episode, date_str, duration)
 
-    console.print(table)
-
+    # Emit the table and footer in a single print call
+    renderables = [table]
     if total > per_page:
         total_pages = (total + per_page - 1) // per_page
-        console.print(f"\n[dim]Page {page} of {total_pages} ({total} total transcripts)[/dim]")
+        renderables.append(Text(f"\nPage {page} of {total_pages} ({total} total transcripts)", style="dim"))
+
+    _write_rendered(Group(*renderables))
 
 
 def display_transcript(transcript: Transcript, show_timestamps: bool = False):
@@ -87,24 +117,27 @@ def display_transcript(transcript: Transcript, show_timestamps: bool = False):
     else:
         content = transcript.full_text
 
-    # Split into pages for readability
-    words = content.split()
-    words_per_page = 500
-    total_pages = (len(words) + words_per_page - 1) // words_per_page
+    # Split into pages for readability; each match is a run of up to
+    # WORDS_PER_PAGE words with its original spacing and newlines intact
+    pages = [match.group().strip() for match in _PAGE_RE.finditer(content)]
+    total_pages = len(pages)
 
-    for page_num in range(total_pages):
-        start_idx = page_num * words_per_page
-        end_idx = min(start_idx + words_per_page, len(words))
-        page_content = " ".join(words[start_idx:end_idx])
+    for page_num, page_content in enumerate(pages):
 
+        # Build the whole page up front so it is written in one print call
+        renderables = []
         if total_pages > 1:
-            console.print(f"\n[dim]--- Page {page_num + 1} of {total_pages} ---[/dim]\n")
+            renderables.append(Text(f"\n--- Page {page_num + 1} of {total_pages} ---\n", style="dim"))
+
+        # Transcripts are plain prose, so skip markup and Markdown parsing
+        renderables.append(Text(page_content))
+
+        if page_num < total_pages - 1:
+            renderables.append(Text("\nPress Enter to continue...", style="dim"))
 
-        # Use Markdown for better formatting
-        console.print(Markdown(page_content))
+        _write_rendered(Group(*renderables))
 
         if page_num < total_pages - 1:
-            console.print("\n[dim]Press Enter to continue...[/dim]")
             input()
 
 
@@ -1,6 +1,5 @@
 """Export transcripts to clipboard or file."""
 
-import re
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -12,6 +11,12 @@ except ImportError:
 
 from podcrack.models import Transcript
 
+# Buffer size for streaming transcripts to disk
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# Characters not allowed in filenames, mapped to underscores
+_INVALID_FILENAME_CHARS = str.maketrans({char: "_" for char in '<>:"/\\|?*'})
+
 
 def copy_to_clipboard(text: str) -> bool:
     """
@@ -55,7 +60,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename safe for filesystem
     """
     # Remove or replace invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', "_", filename)
+    filename = filename.translate(_INVALID_FILENAME_CHARS)
     # Remove leading/trailing dots and spaces
     filename = filename.strip(". ")
     # Limit length
@@ -87,13 +92,19 @@ def save_to_file(transcript: Transcript, file_path: Optional[Path] = None, inclu
     # Ensure directory exists
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Get text content
+    # Stream segments straight to a buffered file instead of building the
+    # whole transcript string first
     if include_timestamps:
-        content = transcript.text_with_timestamps
+        lines = transcript.iter_lines_with_timestamps()
+        separator = "\n"
     else:
-        content = transcript.full_text
-
-    # Write file
-    file_path.write_text(content, encoding="utf-8")
+        lines = (segment.text for segment in transcript.segments)
+        separator = " "
+
+    with open(file_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        for line_num, line in enumerate(lines):
+            if line_num:
+                f.write(separator)
+            f.write(line)
 
     return file_path
@@ -1,8 +1,9 @@
 """Main entry point for podcrack CLI."""
 
+import sqlite3
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import questionary
 from rich.console import Console
@@ -16,36 +17,43 @@ from podcrack.display import (
     print_transcript_list,
 )
 from podcrack.export import copy_to_clipboard, save_to_file
-from podcrack.metadata import enrich_transcript_metadata
+from podcrack.metadata import MetadataLookup, enrich_transcript_metadata
 from podcrack.models import Transcript
-from podcrack.parser import parse_ttml
+from podcrack.parser import parse_all
 from podcrack.scanner import check_sqlite_db_exists, scan_ttml_files
 
 console = Console()
 
 
-def fuzzy_match(query: str, text: str) -> bool:
-    """Simple fuzzy matching - check if query words appear in text."""
-    if not query:
-        return True
-    query_lower = query.lower()
-    text_lower = text.lower()
-    return query_lower in text_lower
+def build_search_index(transcripts: List[Transcript]) -> List[Tuple[Transcript, str]]:
+    """
+    Precompute a lowercase search string for each transcript.
+
+    Podcast name and episode title are joined with a NUL separator so a query
+    can never match across the two fields.
+    """
+    return [
+        (
+            transcript,
+            (transcript.podcast_name or "").lower() + "\x00" + (transcript.episode_title or transcript.file_path.stem).lower(),
+        )
+        for transcript in transcripts
+    ]
 
 
-def filter_transcripts(transcripts: List[Transcript], query: str) -> List[Transcript]:
-    """Filter transcripts by search query."""
+def filter_transcripts(search_index: List[Tuple[Transcript, str]], query: str) -> List[Transcript]:
+    """Filter transcripts by search query using a prebuilt search index."""
     if not query:
-        return transcripts
+        return [transcript for transcript, _ in search_index]
+
+    query_lower = query.lower()
+    return [transcript for transcript, haystack in search_index if query_lower in haystack]
 
-    filtered = []
-    for transcript in transcripts:
-        podcast = transcript.podcast_name or ""
-        episode = transcript.episode_title or transcript.file_path.stem
-        if fuzzy_match(query, podcast) or fuzzy_match(query, episode):
-            filtered.append(transcript)
 
-    return filtered
+def transcript_sort_key(transcript: Transcript) -> Tuple[float, float]:
+    """Sort key ordering transcripts by publish date, then file modification time."""
+    publish_timestamp = transcript.publish_date.timestamp() if transcript.publish_date else 0
+    return publish_timestamp, transcript.file_mtime or 0
 
 
 def load_all_transcripts() -> List[Transcript]:
@@ -77,32 +85,67 @@ def load_all_transcripts() -> List[Transcript]:
     if not db_available:
         print_info("SQLite database not found. Using filenames for episode titles.\n")
 
-    for ttml_file in ttml_files:
+    # Share one database connection across all lookups
+    lookup = None
+    if db_available:
         try:
-            transcript = parse_ttml(ttml_file)
-            if db_available:
-                enrich_transcript_metadata(transcript)
-            else:
-                # Fallback to filename
-                transcript.episode_title = ttml_file.stem
+            lookup = MetadataLookup()
+        except sqlite3.Error:
+            print_info("Could not open SQLite database. Using filenames for episode titles.\n")
+
+    # Files are parsed in worker processes; enrichment happens here as results
+    # arrive, so the shared SQLite connection stays on this thread
+    try:
+        for ttml_file, transcript, error in parse_all(ttml_files):
+            if transcript is None:
+                # Skip corrupt files
+                console.print(f"[yellow]⚠️  Skipping {ttml_file.name}: {error}[/yellow]")
+                continue
+
+            try:
+                if lookup is not None:
+                    enrich_transcript_metadata(transcript, lookup=lookup)
+                else:
+                    # Fallback to filename
+                    transcript.episode_title = ttml_file.stem
+            except Exception as e:
+                # Skip files whose metadata can't be read, as a parse failure would be
+                console.print(f"[yellow]⚠️  Skipping {ttml_file.name}: {e}[/yellow]")
+                continue
             transcripts.append(transcript)
-        except Exception as e:
-            # Skip corrupt files
-            console.print(f"[yellow]⚠️  Skipping {ttml_file.name}: {e}[/yellow]")
-            continue
+    finally:
+        if lookup is not None:
+            lookup.close()
 
     # Sort by date (newest first)
-    transcripts.sort(
-        key=lambda t: (
-            t.publish_date.timestamp() if t.publish_date else 0,
-            t.file_path.stat().st_mtime,
-        ),
-        reverse=True,
-    )
+    transcripts.sort(key=transcript_sort_key, reverse=True)
 
     return transcripts
 
 
+def _fast_prompt(message: str, default: str = "") -> Optional[str]:
+    """
+    Read a line of input with plain input().
+
+    Used for the main loop's prompts instead of questionary, which builds a
+    full prompt_toolkit application on every call.
+    Returns None on Ctrl-C or EOF, like questionary's ask().
+    """
+    try:
+        return input(f"{message}: ") or default
+    except (EOFError, KeyboardInterrupt):
+        return None
+
+
+def _fast_confirm(message: str, default: bool = False) -> bool:
+    """Ask a yes/no question with plain input()."""
+    hint = "[Y/n]" if default else "[y/N]"
+    answer = _fast_prompt(f"{message} {hint}")
+    if not answer:
+        return default
+    return answer.strip().lower() in ("y", "yes")
+
+
 def transcript_action_menu(transcript: Transcript) -> str:
     """Show action menu for a selected transcript."""
     title = transcript.episode_title or transcript.file_path.stem
@@ -131,6 +174,7 @@ def main():
 
     # Load all transcripts
     transcripts = load_all_transcripts()
+    search_index = build_search_index(transcripts)
 
     current_page = 1
     per_page = 20
@@ -138,7 +182,7 @@ def main():
 
     while True:
         # Filter by search query
-        filtered = filter_transcripts(transcripts, search_query)
+        filtered = filter_transcripts(search_index, search_query)
 
         if not filtered:
             console.print("[yellow]No transcripts match your search.[/yellow]\n")
@@ -155,7 +199,7 @@ def main():
         else:
             prompt_text = "🔍 Search, number to select, 'n'/'p' to page, 'q' to quit"
 
-        user_input = questionary.text(prompt_text, default="").ask()
+        user_input = _fast_prompt(prompt_text)
 
         if user_input is None or user_input.lower() == "q":
             console.print("\n[dim]Goodbye![/dim]")
@@ -202,9 +246,7 @@ def main():
                         break
                     elif action == "view":
                         console.print()
-                        show_timestamps = questionary.confirm(
-                            "Show timestamps?", default=False
-                        ).ask()
+                        show_timestamps = _fast_confirm("Show timestamps?", default=False)
                         display_transcript(selected_transcript, show_timestamps=show_timestamps)
                     elif action == "copy":
                         text = selected_transcript.full_text
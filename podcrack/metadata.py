@@ -4,13 +4,17 @@ import re
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-from podcrack.scanner import SQLITE_DB
+from podcrack.scanner import SQLITE_DB, TTML_DIR
 
 if TYPE_CHECKING:
     from podcrack.models import Transcript
 
+# Duplicate filename pattern, e.g. transcript_123.ttml-123.ttml
+# Anchored at both ends so non-matching identifiers are rejected after one attempt from the start
+_DUP_TTML_RE = re.compile(r"\A(.+\.ttml)-\d+\.ttml\Z")
+
 
 def get_transcript_identifier(ttml_file_path: Path) -> str:
     """
@@ -23,153 +27,164 @@ def get_transcript_identifier(ttml_file_path: Path) -> str:
     which should be normalized to transcript_123.ttml
     """
     # Get relative path from TTML base directory
-    ttml_base = Path.home() / "Library/Group Containers/243LU875E5.groups.com.apple.podcasts/Library/Cache/Assets/TTML"
-
     try:
-        relative_path = ttml_file_path.relative_to(ttml_base)
-        identifier = str(relative_path)
+        identifier = str(ttml_file_path.relative_to(TTML_DIR))
+    except ValueError:
+        # If path is not relative to base, use just the filename
+        identifier = ttml_file_path.name
 
-        # Handle duplicate filename pattern (e.g., transcript_123.ttml-123.ttml -> transcript_123.ttml)
-        # Match pattern: anything.ttml-number.ttml at the end
-        identifier = re.sub(r"(.+\.ttml)-\d+\.ttml$", r"\1", identifier)
+    # Handle duplicate filename pattern (e.g., transcript_123.ttml-123.ttml -> transcript_123.ttml)
+    # Match pattern: anything.ttml-number.ttml at the end
+    return _DUP_TTML_RE.sub(r"\1", identifier)
 
-        return identifier
-    except ValueError:
-        # If path is not relative to base, return just the filename (also handle duplicate pattern)
-        filename = ttml_file_path.name
-        filename = re.sub(r"(.+\.ttml)-\d+\.ttml$", r"\1", filename)
-        return filename
 
+def _convert_pub_date(timestamp) -> Optional[datetime]:
+    """Convert ZPUBDATE (seconds since 2001-01-01) to datetime."""
+    if not timestamp:
+        return None
+    try:
+        # Apple uses seconds since 2001-01-01 00:00:00 UTC
+        base_date = datetime(2001, 1, 1)
+        if isinstance(timestamp, (int, float)):
+            return datetime.fromtimestamp(base_date.timestamp() + timestamp)
+    except (ValueError, TypeError, OSError, OverflowError):
+        pass
+    return None
 
-def get_episode_metadata(ttml_file_path: Path) -> Tuple[Optional[str], Optional[str], Optional[datetime]]:
-    """
-    Query the SQLite database to find episode metadata for a TTML file.
 
-    Args:
-        ttml_file_path: Path to the TTML file
+class MetadataLookup:
+    """
+    Reusable connection to the Apple Podcasts database for metadata lookups.
 
-    Returns:
-        Tuple of (podcast_name, episode_title, publish_date)
-        Returns (None, None, None) if not found or database unavailable
+    Opening the database and detecting its schema is done once. On the first
+    lookup all episodes with a transcript are loaded into an in-memory index,
+    so every lookup after that is a dict access instead of a query.
     """
-    if not SQLITE_DB.exists():
-        return None, None, None
 
-    try:
-        conn = sqlite3.connect(str(SQLITE_DB))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Open the database and prepare the metadata query.
 
-        # Get transcript identifier (relative path from TTML base)
-        transcript_identifier = get_transcript_identifier(ttml_file_path)
+        Args:
+            db_path: Path to the SQLite database (defaults to SQLITE_DB)
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        # Open read-only: we never write to the Podcasts app's database.
+        # immutable=1 is deliberately not used, as it would ignore the WAL
+        # file and miss episodes the app has not checkpointed yet.
+        db_uri = Path(db_path or SQLITE_DB).absolute().as_uri() + "?mode=ro"
+        self.conn = sqlite3.connect(db_uri, uri=True)
+        self.conn.row_factory = sqlite3.Row
+        self.cursor = self.conn.cursor()
+        self.cursor.execute("PRAGMA query_only = 1")
+        self.cursor.execute("PRAGMA temp_store = MEMORY")
+        self.cursor.execute("PRAGMA cache_size = -20000")
+        self.query = self._build_query()
+        self._index: Optional[Dict[str, Tuple[Optional[str], Optional[str], Optional[datetime]]]] = None
+
+    def _build_query(self) -> Optional[str]:
+        """Detect the schema variant and build the index query, or None if unsupported."""
+        episode_columns = {row["name"] for row in self.cursor.execute("PRAGMA table_info(ZMTEPISODE)")}
+        podcast_columns = {row["name"] for row in self.cursor.execute("PRAGMA table_info(ZMTPODCAST)")}
+
+        if not episode_columns or not podcast_columns:
+            return None
+
+        # Older schemas only have ZCLEANEDTITLE for the podcast name
+        if "ZTITLE" in podcast_columns:
+            podcast_title_column = "ZTITLE"
+        elif "ZCLEANEDTITLE" in podcast_columns:
+            podcast_title_column = "ZCLEANEDTITLE"
+        else:
+            return None
 
-        # Query using the standard Apple Podcasts schema
         # Join ZMTEPISODE with ZMTPODCAST to get both episode and podcast info
-        query = """
+        return f"""
         SELECT
+            e.ZTRANSCRIPTIDENTIFIER as transcript_identifier,
             e.ZTITLE as episode_title,
             e.ZPUBDATE,
-            e.ZDURATION,
-            p.ZTITLE as podcast_title,
-            p.ZAUTHOR as podcast_author
+            p.{podcast_title_column} as podcast_title
         FROM ZMTEPISODE e
         JOIN ZMTPODCAST p ON e.ZPODCASTUUID = p.ZUUID
-        WHERE e.ZTRANSCRIPTIDENTIFIER = ?
-        LIMIT 1
+        WHERE e.ZTRANSCRIPTIDENTIFIER IS NOT NULL
         """
 
-        cursor.execute(query, (transcript_identifier,))
-        row = cursor.fetchone()
+    def _load_index(self) -> Dict[str, Tuple[Optional[str], Optional[str], Optional[datetime]]]:
+        """Load metadata for every episode with a transcript, keyed by transcript identifier."""
+        index = {}
+        if self.query is None:
+            return index
 
-        if not row:
-            conn.close()
-            return None, None, None
+        try:
+            for row in self.cursor.execute(self.query):
+                # Keep the first match per identifier, as the old LIMIT 1 query did
+                if row["transcript_identifier"] in index:
+                    continue
+                index[row["transcript_identifier"]] = (
+                    row["podcast_title"] if row["podcast_title"] else None,
+                    row["episode_title"] if row["episode_title"] else None,
+                    _convert_pub_date(row["ZPUBDATE"]),
+                )
+        except sqlite3.Error:
+            # The app will fall back to filename-based display
+            return {}
+
+        return index
+
+    def get(self, ttml_file_path: Path) -> Tuple[Optional[str], Optional[str], Optional[datetime]]:
+        """
+        Find episode metadata for a TTML file.
 
-        # Extract values
-        episode_title = row["episode_title"] if row["episode_title"] else None
-        podcast_name = row["podcast_title"] if row["podcast_title"] else None
-        publish_date = None
+        Args:
+            ttml_file_path: Path to the TTML file
 
-        # Convert ZPUBDATE (seconds since 2001-01-01) to datetime
-        if row["ZPUBDATE"]:
-            try:
-                # Apple uses seconds since 2001-01-01 00:00:00 UTC
-                base_date = datetime(2001, 1, 1)
-                timestamp = row["ZPUBDATE"]
-                if isinstance(timestamp, (int, float)):
-                    publish_date = datetime.fromtimestamp(base_date.timestamp() + timestamp)
-            except (ValueError, TypeError, OSError):
-                pass
+        Returns:
+            Tuple of (podcast_name, episode_title, publish_date)
+            Returns (None, None, None) if not found or the schema is unsupported
+        """
+        if self._index is None:
+            self._index = self._load_index()
+
+        # Get transcript identifier (relative path from TTML base)
+        transcript_identifier = get_transcript_identifier(ttml_file_path)
+        return self._index.get(transcript_identifier, (None, None, None))
 
-        conn.close()
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
 
-        return podcast_name, episode_title, publish_date
 
-    except sqlite3.OperationalError as e:
-        # Table or column doesn't exist - schema might be different
-        # Try fallback approach
-        try:
-            conn = sqlite3.connect(str(SQLITE_DB))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            # Check if tables exist
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name IN ('ZMTEPISODE', 'ZMTPODCAST')")
-            tables = [row[0] for row in cursor.fetchall()]
-
-            if "ZMTEPISODE" not in tables or "ZMTPODCAST" not in tables:
-                conn.close()
-                return None, None, None
-
-            # Try alternative column names
-            transcript_identifier = get_transcript_identifier(ttml_file_path)
-
-            # Try with ZCLEANEDTITLE instead of ZTITLE for podcast
-            query = """
-            SELECT
-                e.ZTITLE as episode_title,
-                e.ZPUBDATE,
-                p.ZCLEANEDTITLE as podcast_title,
-                p.ZAUTHOR as podcast_author
-            FROM ZMTEPISODE e
-            JOIN ZMTPODCAST p ON e.ZPODCASTUUID = p.ZUUID
-            WHERE e.ZTRANSCRIPTIDENTIFIER = ?
-            LIMIT 1
-            """
-
-            cursor.execute(query, (transcript_identifier,))
-            row = cursor.fetchone()
-
-            if row:
-                episode_title = row["episode_title"] if row["episode_title"] else None
-                podcast_name = row["podcast_title"] if row["podcast_title"] else None
-                publish_date = None
-
-                if row["ZPUBDATE"]:
-                    try:
-                        base_date = datetime(2001, 1, 1)
-                        timestamp = row["ZPUBDATE"]
-                        if isinstance(timestamp, (int, float)):
-                            publish_date = datetime.fromtimestamp(base_date.timestamp() + timestamp)
-                    except (ValueError, TypeError, OSError):
-                        pass
-
-                conn.close()
-                return podcast_name, episode_title, publish_date
-
-            conn.close()
-            return None, None, None
-
-        except Exception:
-            return None, None, None
-
-    except (sqlite3.Error, Exception):
-        # Silently fail and return None values
-        # The app will fall back to filename-based display
+def get_episode_metadata(ttml_file_path: Path) -> Tuple[Optional[str], Optional[str], Optional[datetime]]:
+    """
+    Query the SQLite database to find episode metadata for a TTML file.
+
+    Opens a one-off connection; use MetadataLookup when looking up many files.
+
+    Args:
+        ttml_file_path: Path to the TTML file
+
+    Returns:
+        Tuple of (podcast_name, episode_title, publish_date)
+        Returns (None, None, None) if not found or database unavailable
+    """
+    if not SQLITE_DB.exists():
         return None, None, None
 
+    try:
+        lookup = MetadataLookup()
+    except sqlite3.Error:
+        return None, None, None
+
+    try:
+        return lookup.get(ttml_file_path)
+    finally:
+        lookup.close()
+
 
-def enrich_transcript_metadata(transcript: "Transcript", podcast_name: Optional[str] = None, episode_title: Optional[str] = None, publish_date: Optional[datetime] = None):
+def enrich_transcript_metadata(transcript: "Transcript", podcast_name: Optional[str] = None, episode_title: Optional[str] = None, publish_date: Optional[datetime] = None, lookup: Optional[MetadataLookup] = None):
     """
     Enrich a Transcript object with metadata.
 
@@ -178,10 +193,14 @@ def enrich_transcript_metadata(transcript: "Transcript", podcast_name: Optional[
         podcast_name: Podcast name (if already known)
         episode_title: Episode title (if already known)
         publish_date: Publish date (if already known)
+        lookup: Open MetadataLookup to reuse (if None, opens a one-off connection)
     """
     # Try to get from database if not all metadata provided
     if not (podcast_name and episode_title and publish_date):
-        db_podcast, db_title, db_date = get_episode_metadata(transcript.file_path)
+        if lookup is not None:
+            db_podcast, db_title, db_date = lookup.get(transcript.file_path)
+        else:
+            db_podcast, db_title, db_date = get_episode_metadata(transcript.file_path)
         transcript.podcast_name = podcast_name or db_podcast
         transcript.episode_title = episode_title or db_title
         transcript.publish_date = publish_date or db_date
@@ -1,12 +1,28 @@
 """Data models for transcripts and episodes."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 
-@dataclass
+def format_timestamp_hms(timestamp: Optional[str]) -> str:
+    """
+    Convert a TTML timestamp like "00:01:23.456" to "00:01:23".
+
+    Returns an empty string for missing timestamps or ones without hours.
+    """
+    if not timestamp:
+        return ""
+    parts = timestamp.split(":")
+    if len(parts) != 3:
+        return ""
+    h, m, s = parts
+    s = s.split(".")[0]  # Remove milliseconds
+    return f"{h}:{m}:{s}"
+
+
+@dataclass(slots=True)
 class Segment:
     """A single timestamped text segment from a transcript."""
 
@@ -14,9 +30,10 @@ class Segment:
     begin: Optional[str] = None  # Timestamp like "00:01:23.456"
     end: Optional[str] = None
     speaker: Optional[str] = None  # Speaker label if present
+    begin_hms: Optional[str] = None  # Precomputed "HH:MM:SS" form of begin ("" if unavailable)
 
 
-@dataclass
+@dataclass(slots=True)
 class Transcript:
     """A complete transcript with metadata."""
 
@@ -26,38 +43,42 @@ class Transcript:
     episode_title: Optional[str] = None
     publish_date: Optional[datetime] = None
     duration_seconds: Optional[float] = None
+    file_mtime: Optional[float] = None  # Modification time of the TTML file, captured at parse time
+    # Memoized derived text; segments are not expected to change after parsing
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @property
     def full_text(self) -> str:
         """Get the full transcript text without timestamps."""
-        return " ".join(segment.text for segment in self.segments)
+        if "full_text" not in self._cache:
+            self._cache["full_text"] = " ".join(segment.text for segment in self.segments)
+        return self._cache["full_text"]
 
-    @property
-    def text_with_timestamps(self) -> str:
-        """Get the transcript text with timestamps formatted as [HH:MM:SS]."""
-        lines = []
+    def iter_lines_with_timestamps(self) -> Iterator[str]:
+        """Yield one line per segment, prefixed with its [HH:MM:SS] timestamp and speaker."""
         for segment in self.segments:
-            timestamp = ""
-            if segment.begin:
-                # Convert timestamp to [HH:MM:SS] format
-                try:
-                    parts = segment.begin.split(":")
-                    if len(parts) == 3:
-                        h, m, s = parts
-                        s = s.split(".")[0]  # Remove milliseconds
-                        timestamp = f"[{h}:{m}:{s}]"
-                except (ValueError, IndexError):
-                    pass
+            # Parsed segments carry a precomputed timestamp; others are formatted here
+            hms = segment.begin_hms
+            if hms is None:
+                hms = format_timestamp_hms(segment.begin)
+            timestamp = f"[{hms}]" if hms else ""
 
             speaker_prefix = f"{segment.speaker}: " if segment.speaker else ""
-            lines.append(f"{timestamp} {speaker_prefix}{segment.text}".strip())
+            yield f"{timestamp} {speaker_prefix}{segment.text}".strip()
 
-        return "\n".join(lines)
+    @property
+    def text_with_timestamps(self) -> str:
+        """Get the transcript text with timestamps formatted as [HH:MM:SS]."""
+        if "text_with_timestamps" not in self._cache:
+            self._cache["text_with_timestamps"] = "\n".join(self.iter_lines_with_timestamps())
+        return self._cache["text_with_timestamps"]
 
     @property
     def word_count(self) -> int:
         """Get approximate word count."""
-        return len(self.full_text.split())
+        if "word_count" not in self._cache:
+            self._cache["word_count"] = len(self.full_text.split())
+        return self._cache["word_count"]
 
     @property
     def duration_formatted(self) -> str:
@@ -1,21 +1,59 @@
 """Parse TTML XML files into Transcript objects."""
 
+import hashlib
+import os
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from xml.etree import ElementTree as ET
 
-from podcrack.models import Segment, Transcript
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+from podcrack.models import Segment, Transcript, format_timestamp_hms
 
 
 # TTML namespace
 TTML_NS = "{http://www.w3.org/ns/ttml}"
+_P_TAG = f"{TTML_NS}p"
+_BODY_TAG = f"{TTML_NS}body"
+
+# Namespaced timing attributes, checked when the plain ones are missing
+TTML_BEGIN = f"{TTML_NS}begin"
+TTML_END = f"{TTML_NS}end"
+
+# Speaker attribute (ttm:agent) used by Apple Podcasts
+TTM_AGENT = "{http://www.w3.org/ns/ttml#metadata}agent"
+
+# On-disk cache of parsed transcripts, keyed by file path, mtime and size
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "podcrack"
+# Bump when Segment/Transcript or parsing output changes to invalidate old entries
+CACHE_VERSION = 3
+
+# Below this many uncached files, parse_all parses in-process; worker startup would cost more than it saves
+PARALLEL_PARSE_THRESHOLD = 32
 
+# Bytes fed to the stdlib parser per read when lxml is unavailable
+READ_CHUNK_SIZE = 64 * 1024
 
+# Runs of whitespace, collapsed to a single space in extracted text
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=8192)
 def parse_timestamp(timestamp_str: str) -> float:
     """
     Parse a TTML timestamp string to seconds.
 
+    Results are memoized since the same timestamps recur across segments
+    (one segment's end is usually the next one's begin).
+
     Formats supported:
     - "00:01:23.456" (hours:minutes:seconds.milliseconds)
     - "01:23.456" (minutes:seconds.milliseconds)
@@ -24,6 +62,21 @@ def parse_timestamp(timestamp_str: str) -> float:
     # Remove any whitespace
     timestamp_str = timestamp_str.strip()
 
+    # Fast path for Apple's fixed-width HH:MM:SS.mmm format: integer parses
+    # on fixed slices, no intermediate list
+    if (
+        len(timestamp_str) == 12
+        and timestamp_str[2] == ":"
+        and timestamp_str[5] == ":"
+        and timestamp_str[8] == "."
+    ):
+        return (
+            int(timestamp_str[0:2]) * 3600
+            + int(timestamp_str[3:5]) * 60
+            + int(timestamp_str[6:8])
+            + int(timestamp_str[9:12]) / 1000
+        )
+
     # Split by colon
     parts = timestamp_str.split(":")
     total_seconds = 0.0
@@ -44,30 +97,12 @@ def extract_text_from_element(elem: ET.Element) -> str:
     """
     Extract and concatenate all text from an element and its children.
 
-    This recursively traverses all nested <span> elements to extract text,
-    matching the approach used by Apple Podcasts TTML files.
+    This walks all nested <span> elements to extract text, matching the
+    approach used by Apple Podcasts TTML files. The traversal is done by
+    itertext(), which runs in C for both lxml and ElementTree.
     """
-    text_parts = []
-
-    def collect_text(e):
-        """Recursively collect text from element and all descendants."""
-        # Get direct text content
-        if e.text and e.text.strip():
-            text_parts.append(e.text.strip())
-        # Recursively process all children
-        for child in e:
-            collect_text(child)
-        # Get tail text (text after this element, before next sibling)
-        if e.tail and e.tail.strip():
-            text_parts.append(e.tail.strip())
-
-    collect_text(elem)
-
-    # Join and normalize whitespace
-    text = " ".join(text_parts)
-    # Replace multiple spaces/newlines with single space
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    # Join with spaces so adjacent spans don't run together, then normalize whitespace
+    return _WS_RE.sub(" ", " ".join(elem.itertext())).strip()
 
 
 def group_segments_into_paragraphs(segments: List[Segment], gap_threshold: float = 2.0) -> List[str]:
@@ -84,40 +119,184 @@ def group_segments_into_paragraphs(segments: List[Segment], gap_threshold: float
     if not segments:
         return []
 
-    paragraphs = []
-    current_paragraph = []
+    # Record the index where each paragraph starts, then join each slice once
+    boundaries = [0]
+    _parse_timestamp = parse_timestamp  # Local lookup inside the loop
+    prev_end = None  # Parsed end of the previous segment, carried between iterations
 
     for i, segment in enumerate(segments):
-        if not current_paragraph:
-            current_paragraph.append(segment.text)
-        else:
-            # Check gap from previous segment
-            prev_segment = segments[i - 1]
-            if prev_segment.end and segment.begin:
-                try:
-                    prev_end = parse_timestamp(prev_segment.end)
-                    curr_begin = parse_timestamp(segment.begin)
-                    gap = curr_begin - prev_end
-
-                    if gap > gap_threshold:
-                        # Start new paragraph
-                        paragraphs.append(" ".join(current_paragraph))
-                        current_paragraph = [segment.text]
-                    else:
-                        current_paragraph.append(segment.text)
-                except (ValueError, TypeError):
-                    # If timestamp parsing fails, just append
-                    current_paragraph.append(segment.text)
-            else:
-                current_paragraph.append(segment.text)
-
-    # Add final paragraph
-    if current_paragraph:
-        paragraphs.append(" ".join(current_paragraph))
+        # Check gap from previous segment
+        if prev_end is not None and segment.begin:
+            try:
+                gap = _parse_timestamp(segment.begin) - prev_end
+                if gap > gap_threshold:
+                    # Start new paragraph
+                    boundaries.append(i)
+            except (ValueError, TypeError):
+                # If timestamp parsing fails, keep the current paragraph
+                pass
+
+        try:
+            prev_end = _parse_timestamp(segment.end) if segment.end else None
+        except (ValueError, TypeError):
+            prev_end = None
+
+    boundaries.append(len(segments))
+
+    paragraphs = [
+        " ".join(segment.text for segment in segments[start:end])
+        for start, end in zip(boundaries, boundaries[1:])
+    ]
 
     return paragraphs
 
 
+def _iter_paragraphs_lxml(file_path: Path) -> Iterator[Tuple[dict, str]]:
+    """
+    Stream (attributes, text) pairs for each <p> in <body> using lxml's iterparse.
+
+    Each <p> is cleared (and earlier siblings dropped) once the caller has
+    processed it, so memory stays flat regardless of file size. Comments and
+    processing instructions are dropped while parsing, so text around them
+    joins up exactly as it does with the stdlib parser.
+    """
+    in_body = False
+    events = lxml_etree.iterparse(
+        str(file_path),
+        events=("start", "end"),
+        tag=(_BODY_TAG, "body", _P_TAG, "p"),
+        remove_comments=True,
+        remove_pis=True,
+    )
+    for event, elem in events:
+        if elem.tag == _BODY_TAG or elem.tag == "body":
+            in_body = event == "start"
+        elif event == "end" and in_body:
+            yield elem.attrib, extract_text_from_element(elem)
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+class _TTMLTarget:
+    """
+    ElementTree parser target that collects (attributes, text) for each <p> in <body>.
+
+    Used when lxml is not installed. The C parser calls start/data/end
+    directly, so no Element objects are ever created for the document.
+    """
+
+    def __init__(self):
+        self.paragraphs: List[Tuple[dict, str]] = []
+        self._attrs: Optional[dict] = None
+        self._text: List[str] = []
+        self._depth = 0  # elements open inside the current <p>
+        self._in_body = False
+
+    def start(self, tag: str, attrib: dict) -> None:
+        if self._attrs is not None:
+            # Element boundaries separate text like itertext() + " ".join does
+            self._depth += 1
+            self._text.append(" ")
+        elif tag == _BODY_TAG or tag == "body":
+            self._in_body = True
+        elif self._in_body and (tag == _P_TAG or tag == "p"):
+            self._attrs = attrib
+            self._text = []
+
+    def data(self, data: str) -> None:
+        if self._attrs is not None:
+            self._text.append(data)
+
+    def end(self, tag: str) -> None:
+        if self._attrs is None:
+            if tag == _BODY_TAG or tag == "body":
+                self._in_body = False
+            return
+        if self._depth:
+            self._depth -= 1
+            self._text.append(" ")
+            return
+        text = _WS_RE.sub(" ", "".join(self._text)).strip()
+        self.paragraphs.append((self._attrs, text))
+        self._attrs = None
+        self._text = []
+
+    def close(self) -> None:
+        return None
+
+
+def _iter_paragraphs_etree(file_path: Path) -> Iterator[Tuple[dict, str]]:
+    """
+    Stream (attributes, text) pairs for each <p> using a parser target.
+
+    The file is fed to the parser in READ_CHUNK_SIZE pieces and paragraphs
+    are handed out after every chunk, so no tree is ever built.
+    """
+    target = _TTMLTarget()
+    parser = ET.XMLParser(target=target)
+    paragraphs = target.paragraphs
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+            parser.feed(chunk)
+            yield from paragraphs
+            paragraphs.clear()
+    parser.close()
+    yield from paragraphs
+
+
+def iter_segments(file_path: Path) -> Iterator[Segment]:
+    """
+    Stream the non-empty segments of a TTML file in document order.
+
+    Paragraph elements are freed as soon as their segment is built, so
+    consumers that don't need the whole list can process long episodes
+    in constant memory.
+
+    Args:
+        file_path: Path to the .ttml file
+
+    Yields:
+        Segment objects
+
+    Raises:
+        ET.ParseError: If the XML is malformed (lxml.etree.XMLSyntaxError when lxml is installed)
+        OSError: If the file can't be read
+    """
+    # Use lxml's streaming parser when available
+    if lxml_etree is not None:
+        paragraphs = _iter_paragraphs_lxml(file_path)
+    else:
+        paragraphs = _iter_paragraphs_etree(file_path)
+
+    # Bind hot-loop callables to locals to skip global and attribute lookups per <p>
+    format_hms = format_timestamp_hms
+
+    for attrib, text in paragraphs:
+        get = attrib.get
+        begin = get("begin") or get(TTML_BEGIN)
+        end = get("end") or get(TTML_END)
+
+        # Extract speaker if present
+        # Apple Podcasts uses ttm:agent attribute with namespace
+        speaker = get(TTM_AGENT)
+        if speaker is None:
+            # Check all attributes for other speaker-related ones
+            for key, value in attrib.items():
+                if "agent" in key.lower() or "speaker" in key.lower():
+                    speaker = value
+                    break
+
+        if text:  # Only yield non-empty segments
+            yield Segment(
+                text=text,
+                begin=begin,
+                end=end,
+                speaker=speaker,
+                begin_hms=format_hms(begin),
+            )
+
+
 def parse_ttml(file_path: Path) -> Transcript:
     """
     Parse a TTML file into a Transcript object.
@@ -129,67 +308,166 @@ def parse_ttml(file_path: Path) -> Transcript:
         Transcript object with parsed segments
 
     Raises:
-        ET.ParseError: If the XML is malformed
+        ET.ParseError: If the XML is malformed (lxml.etree.XMLSyntaxError when lxml is installed)
         FileNotFoundError: If the file doesn't exist
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"TTML file not found: {file_path}")
+    # Stat once up front; the mtime is reused for sorting and display
+    try:
+        file_mtime = file_path.stat().st_mtime
+    except FileNotFoundError:
+        raise FileNotFoundError(f"TTML file not found: {file_path}") from None
 
-    tree = ET.parse(file_path)
-    root = tree.getroot()
+    segments = list(iter_segments(file_path))
 
-    segments = []
+    # Segments are in document order, so the duration is the last end timestamp
     last_timestamp = None
-
-    # Find all <p> elements in the body
-    # TTML structure: <tt><body><div><p>...</p></div></body></tt>
-    body = root.find(f".//{TTML_NS}body")
-    if body is None:
-        # Try without namespace
-        body = root.find(".//body")
-
-    if body is not None:
-        for div in body.findall(f"{TTML_NS}div") + body.findall("div"):
-            for p in div.findall(f"{TTML_NS}p") + div.findall("p"):
-                begin = p.get("begin") or p.get(f"{{{TTML_NS}}}begin")
-                end = p.get("end") or p.get(f"{{{TTML_NS}}}end")
-
-                # Extract speaker if present
-                # Apple Podcasts uses ttm:agent attribute with namespace
-                speaker = None
-                # Check all attributes for speaker-related ones
-                for key, value in p.attrib.items():
-                    if "agent" in key.lower() or "speaker" in key.lower():
-                        speaker = value
-                        break
-                # Also try the standard ttm:agent namespace
-                ttm_ns = "{http://www.w3.org/ns/ttml#metadata}"
-                if not speaker:
-                    speaker = p.get(f"{ttm_ns}agent")
-
-                # Extract text
-                text = extract_text_from_element(p)
-
-                if text:  # Only add non-empty segments
-                    segment = Segment(
-                        text=text,
-                        begin=begin,
-                        end=end,
-                        speaker=speaker,
-                    )
-                    segments.append(segment)
-
-                    # Track last timestamp for duration
-                    if end:
-                        try:
-                            timestamp_seconds = parse_timestamp(end)
-                            if last_timestamp is None or timestamp_seconds > last_timestamp:
-                                last_timestamp = timestamp_seconds
-                        except (ValueError, TypeError):
-                            pass
+    final_end = next((segment.end for segment in reversed(segments) if segment.end), None)
+    if final_end:
+        try:
+            last_timestamp = parse_timestamp(final_end)
+        except (ValueError, TypeError):
+            pass
 
     return Transcript(
         file_path=file_path,
         segments=segments,
         duration_seconds=last_timestamp,
+        file_mtime=file_mtime,
     )
+
+
+def _cache_path(file_path: Path, cache_dir: Path) -> Path:
+    """
+    Locate the cache entry for a TTML file from its path, mtime and size.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"TTML file not found: {file_path}") from None
+
+    key = hashlib.blake2b(
+        f"{CACHE_VERSION}:{file_path}:{st.st_mtime_ns}:{st.st_size}".encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    return cache_dir / key[:2] / key
+
+
+def _load_cached(cache_path: Path) -> Optional[Transcript]:
+    """Load a cached transcript, or None if the entry is missing or unreadable."""
+    try:
+        with open(cache_path, "rb") as f:
+            transcript = pickle.load(f)
+        if isinstance(transcript, Transcript):
+            return transcript
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError):
+        pass
+    return None
+
+
+def _parse_and_store(file_path: Path, cache_path: Path) -> Transcript:
+    """Parse a TTML file and write the result to its cache entry, ignoring write failures."""
+    transcript = parse_ttml(file_path)
+
+    # Write to a temporary file and rename, so concurrent workers never see a partial entry
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(transcript, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return transcript
+
+
+def parse_ttml_cached(file_path: Path, cache_dir: Optional[Path] = None) -> Transcript:
+    """
+    Parse a TTML file, reusing a pickled result from a previous run if the file is unchanged.
+
+    Apple Podcasts never rewrites a cached TTML file in place, so (path, mtime, size)
+    identifies its contents. Cache read/write failures fall back to parsing.
+
+    Args:
+        file_path: Path to the .ttml file
+        cache_dir: Cache location (defaults to CACHE_DIR)
+
+    Returns:
+        Transcript object with parsed segments
+
+    Raises:
+        Same as parse_ttml
+    """
+    cache_path = _cache_path(file_path, cache_dir or CACHE_DIR)
+    transcript = _load_cached(cache_path)
+    if transcript is None:
+        transcript = _parse_and_store(file_path, cache_path)
+    return transcript
+
+
+def _parse_ttml_or_error(file_path: Path, cache_path: Path) -> Tuple[Optional[Transcript], Optional[str]]:
+    """Parse and cache a TTML file, returning the error message instead of raising (lxml errors can't be pickled)."""
+    try:
+        return _parse_and_store(file_path, cache_path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def parse_all(file_paths: List[Path]) -> Iterator[Tuple[Path, Optional[Transcript], Optional[str]]]:
+    """
+    Parse many TTML files, spreading the work across CPU cores.
+
+    Cached transcripts are loaded in this process first; only files missing
+    from the cache are parsed, in worker processes when there are enough of them.
+
+    Args:
+        file_paths: Paths to .ttml files
+
+    Yields:
+        (file_path, transcript, error) in input order; transcript is None and
+        error holds the message if the file could not be parsed
+    """
+    # Resolved here: spawned workers re-import this module and would
+    # otherwise see the import-time CACHE_DIR, not the caller's
+    cache_dir = CACHE_DIR
+
+    done: Dict[int, Tuple[Optional[Transcript], Optional[str]]] = {}
+    misses: List[Tuple[Path, Path]] = []
+    for i, file_path in enumerate(file_paths):
+        try:
+            cache_path = _cache_path(file_path, cache_dir)
+        except OSError as e:
+            done[i] = (None, str(e))
+            continue
+        transcript = _load_cached(cache_path)
+        if transcript is not None:
+            done[i] = (transcript, None)
+        else:
+            misses.append((file_path, cache_path))
+
+    miss_results = _parse_misses(misses)
+    for i, file_path in enumerate(file_paths):
+        yield (file_path, *(done.pop(i) if i in done else next(miss_results)))
+
+
+def _parse_misses(misses: List[Tuple[Path, Path]]) -> Iterator[Tuple[Optional[Transcript], Optional[str]]]:
+    """Parse (file_path, cache_path) pairs in order, in worker processes when there are enough."""
+    parsed = 0
+    # A single core gains nothing from workers, only their startup cost
+    if len(misses) >= PARALLEL_PARSE_THRESHOLD and (os.cpu_count() or 1) > 1:
+        file_paths, cache_paths = zip(*misses)
+        try:
+            with ProcessPoolExecutor() as executor:
+                for result in executor.map(_parse_ttml_or_error, file_paths, cache_paths, chunksize=8):
+                    yield result
+                    parsed += 1
+            return
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); parse the rest in-process
+            pass
+
+    for file_path, cache_path in misses[parsed:]:
+        yield _parse_ttml_or_error(file_path, cache_path)
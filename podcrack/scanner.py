@@ -1,12 +1,45 @@
 """Scan for TTML transcript files in Apple Podcasts cache directory."""
 
+import os
+import stat
+from operator import itemgetter
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Tuple
 
 # Apple Podcasts cache directory
 TTML_DIR = Path.home() / "Library/Group Containers/243LU875E5.groups.com.apple.podcasts/Library/Cache/Assets/TTML"
 SQLITE_DB = Path.home() / "Library/Group Containers/243LU875E5.groups.com.apple.podcasts/Documents/MTLibrary.sqlite"
 
+# Transcript file extension, matched against raw directory entry names
+TTML_SUFFIX = ".ttml"
+
+
+def _walk_ttml_files(directory: str) -> Iterator[Tuple[float, str]]:
+    """
+    Recursively yield (mtime, path) for each .ttml file under a directory.
+
+    Uses os.fwalk so each file is stat'ed relative to its already-open
+    directory descriptor instead of resolving the full path from the root
+    every time. Symlinked directories are not followed and unreadable
+    subdirectories are skipped, matching Path.rglob. The directory itself may
+    be a symlink; yielded paths stay under the name it was given by.
+    """
+    suffix = TTML_SUFFIX
+    # fwalk won't enter a symlinked top directory, so walk its target and rebase
+    real_root = os.path.realpath(directory)
+    for real_dirpath, _, filenames, dirfd in os.fwalk(real_root):
+        dirpath = directory + real_dirpath[len(real_root):]
+        for name in filenames:
+            if not name.endswith(suffix):
+                continue
+            try:
+                file_stat = os.stat(name, dir_fd=dirfd)
+            except FileNotFoundError:
+                # Removed by Podcasts since the directory was listed, or a dangling symlink
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
+                yield file_stat.st_mtime, os.path.join(dirpath, name)
+
 
 def scan_ttml_files() -> List[Path]:
     """
@@ -19,26 +52,26 @@ def scan_ttml_files() -> List[Path]:
         FileNotFoundError: If the TTML directory doesn't exist.
         PermissionError: If access to the directory is denied.
     """
-    if not TTML_DIR.exists():
+    # One stat covers both the existence and the directory check
+    try:
+        dir_stat = TTML_DIR.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"TTML directory not found: {TTML_DIR}\n"
             "Make sure Apple Podcasts has cached transcripts. "
             "Open a transcript in the Podcasts app first."
-        )
+        ) from None
 
-    if not TTML_DIR.is_dir():
+    if not stat.S_ISDIR(dir_stat.st_mode):
         raise NotADirectoryError(f"Expected directory but found: {TTML_DIR}")
 
     # Recursively search for .ttml files in subdirectories
-    ttml_files = list(TTML_DIR.rglob("*.ttml"))
-
-    # Filter out any non-file entries (shouldn't happen, but be safe)
-    ttml_files = [f for f in ttml_files if f.is_file()]
+    ttml_files = list(_walk_ttml_files(str(TTML_DIR)))
 
     # Sort by modification time, newest first
-    ttml_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    ttml_files.sort(key=itemgetter(0), reverse=True)
 
-    return ttml_files
+    return [Path(path) for _, path in ttml_files]
 
 
 def get_sqlite_db_path() -> Path:
@@ -48,4 +81,5 @@ def get_sqlite_db_path() -> Path:
 
 def check_sqlite_db_exists() -> bool:
     """Check if the SQLite database exists."""
-    return SQLITE_DB.exists() and SQLITE_DB.is_file()
+    # One stat via os.path; Path.exists() + is_file() would stat twice
+    return os.path.isfile(SQLITE_DB)
@@ -0,0 +1,73 @@
+"""Tests for terminal display."""
+
+import re
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from podcrack import display
+from podcrack.display import display_transcript
+from podcrack.models import Segment, Transcript
+
+WORD_RE = re.compile(r"\bw\d+\b")
+TIMESTAMPED_LINE_RE = re.compile(r"^\[\d\d:\d\d:\d\d\] w\d+$")
+
+
+def make_transcript(word_count: int) -> Transcript:
+    """Create a transcript with one numbered word per segment, one second apart."""
+    segments = [
+        Segment(text=f"w{i}", begin=f"{i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}.000")
+        for i in range(word_count)
+    ]
+    return Transcript(
+        file_path=Path("/tmp/test.ttml"),
+        segments=segments,
+        podcast_name="Podcast",
+        episode_title="Episode",
+    )
+
+
+class TestDisplayTranscript:
+    """Test paging of transcripts in the terminal."""
+
+    @pytest.fixture(autouse=True)
+    def wide_console(self, monkeypatch):
+        """Render without wrapping or styling, and answer every page prompt."""
+        monkeypatch.setattr(display, "console", Console(width=10000, color_system=None))
+        self.prompts = 0
+
+        def fake_input(*args):
+            self.prompts += 1
+            return ""
+
+        monkeypatch.setattr("builtins.input", fake_input)
+
+    def test_single_page(self, capsys):
+        """Test a short transcript is shown without page markers."""
+        display_transcript(make_transcript(10))
+        output = capsys.readouterr().out
+
+        assert "--- Page" not in output
+        assert WORD_RE.findall(output) == [f"w{i}" for i in range(10)]
+        assert self.prompts == 0
+
+    def test_pages_keep_every_word_once(self, capsys):
+        """Test words split across 500-word pages are neither lost nor duplicated."""
+        display_transcript(make_transcript(1201))
+        output = capsys.readouterr().out
+
+        assert re.findall(r"--- Page (\d) of (\d) ---", output) == [("1", "3"), ("2", "3"), ("3", "3")]
+        assert WORD_RE.findall(output) == [f"w{i}" for i in range(1201)]
+        assert self.prompts == 2
+
+    def test_timestamped_pages_keep_lines(self, capsys):
+        """Test timestamped mode pages by word but keeps one segment per line."""
+        transcript = make_transcript(600)
+        display_transcript(transcript, show_timestamps=True)
+        output = capsys.readouterr().out
+
+        # Each line is two words, so 1200 words make three pages
+        assert re.findall(r"--- Page (\d) of (\d) ---", output) == [("1", "3"), ("2", "3"), ("3", "3")]
+        lines = [line for line in output.splitlines() if TIMESTAMPED_LINE_RE.match(line)]
+        assert lines == transcript.text_with_timestamps.split("\n")
@@ -111,3 +111,22 @@ class TestSaveToFile:
         
         content = file_path.read_text()
         assert "[00:00:01]" in content or "[00:00:02]" in content
+
+    def test_save_to_file_matches_transcript_text(self, tmp_path):
+        """Test streamed output matches the in-memory transcript text."""
+        from podcrack.export import save_to_file
+
+        transcript = Transcript(
+            file_path=Path("/test/file.ttml"),
+            segments=[
+                Segment(text="Hello", begin="00:00:01.250", speaker="SPEAKER_1"),
+                Segment(text="big", begin="00:00:02.000"),
+                Segment(text="world"),
+            ]
+        )
+
+        plain = save_to_file(transcript, file_path=tmp_path / "plain.txt")
+        timestamped = save_to_file(transcript, file_path=tmp_path / "ts.txt", include_timestamps=True)
+
+        assert plain.read_text(encoding="utf-8") == transcript.full_text
+        assert timestamped.read_text(encoding="utf-8") == transcript.text_with_timestamps
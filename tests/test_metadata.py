@@ -1,13 +1,14 @@
 """Tests for metadata extraction."""
 
 import re
+import sqlite3
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from podcrack.metadata import get_transcript_identifier
+from podcrack.metadata import MetadataLookup, get_transcript_identifier
 
 
 class TestGetTranscriptIdentifier:
@@ -67,6 +68,14 @@ class TestGetTranscriptIdentifier:
             identifier = mock_get_identifier(file_path)
             assert identifier == "PodcastContent221/file.ttml"
 
+    def test_get_transcript_identifier_under_ttml_dir(self, monkeypatch):
+        """Test identifier is the duplicate-normalized path relative to TTML_DIR."""
+        ttml_dir = Path("/cache/TTML")
+        monkeypatch.setattr("podcrack.metadata.TTML_DIR", ttml_dir)
+
+        identifier = get_transcript_identifier(ttml_dir / "PodcastContent221/file.ttml-123.ttml")
+        assert identifier == "PodcastContent221/file.ttml"
+
     def test_get_transcript_identifier_not_relative(self):
         """Test fallback when path is not relative to base."""
         file_path = Path("/some/other/path/file.ttml")
@@ -80,3 +89,94 @@ class TestGetTranscriptIdentifier:
         
         identifier = get_transcript_identifier(file_path)
         assert identifier == "file.ttml"
+
+
+def create_sample_db(db_path: Path, podcast_title_column: str = "ZTITLE") -> Path:
+    """Create a minimal Apple Podcasts database with one episode."""
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("CREATE TABLE ZMTEPISODE (ZTITLE TEXT, ZPUBDATE REAL, ZPODCASTUUID TEXT, ZTRANSCRIPTIDENTIFIER TEXT)")
+    conn.execute(f"CREATE TABLE ZMTPODCAST (ZUUID TEXT, {podcast_title_column} TEXT)")
+    conn.execute("INSERT INTO ZMTEPISODE VALUES ('Test Episode', 0, 'uuid-1', 'file.ttml')")
+    conn.execute("INSERT INTO ZMTPODCAST VALUES ('uuid-1', 'Test Podcast')")
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+class TestMetadataLookup:
+    """Test metadata lookups against the SQLite database."""
+
+    @pytest.mark.parametrize("podcast_title_column", ["ZTITLE", "ZCLEANEDTITLE"])
+    def test_get_found(self, tmp_path, podcast_title_column):
+        """Test finding metadata with either schema variant."""
+        db_path = create_sample_db(tmp_path / "db.sqlite", podcast_title_column)
+        lookup = MetadataLookup(db_path)
+        try:
+            podcast, title, date = lookup.get(Path("/some/path/file.ttml-123.ttml"))
+        finally:
+            lookup.close()
+
+        assert podcast == "Test Podcast"
+        assert title == "Test Episode"
+        assert date is None
+
+    def test_get_not_found(self, tmp_path):
+        """Test unknown transcripts return empty metadata."""
+        db_path = create_sample_db(tmp_path / "db.sqlite")
+        lookup = MetadataLookup(db_path)
+        try:
+            assert lookup.get(Path("/some/path/other.ttml")) == (None, None, None)
+        finally:
+            lookup.close()
+
+    def test_get_uses_index(self, tmp_path):
+        """Test the database is queried once and later lookups use the index."""
+        db_path = create_sample_db(tmp_path / "db.sqlite")
+        lookup = MetadataLookup(db_path)
+        try:
+            assert lookup.get(Path("/some/path/file.ttml"))[1] == "Test Episode"
+            lookup.conn.close()
+            assert lookup.get(Path("/other/path/file.ttml"))[1] == "Test Episode"
+        finally:
+            lookup.close()
+
+    def test_out_of_range_pub_date(self, tmp_path):
+        """Test a publish date too large for datetime doesn't abort the index load."""
+        db_path = create_sample_db(tmp_path / "db.sqlite")
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("INSERT INTO ZMTEPISODE VALUES ('Bad Date', 1e20, 'uuid-1', 'bad.ttml')")
+        conn.commit()
+        conn.close()
+
+        lookup = MetadataLookup(db_path)
+        try:
+            assert lookup.get(Path("/some/path/bad.ttml")) == ("Test Podcast", "Bad Date", None)
+            assert lookup.get(Path("/some/path/file.ttml"))[1] == "Test Episode"
+        finally:
+            lookup.close()
+
+    def test_get_missing_tables(self, tmp_path):
+        """Test databases without the expected tables return empty metadata."""
+        db_path = tmp_path / "empty.sqlite"
+        sqlite3.connect(str(db_path)).close()
+        lookup = MetadataLookup(db_path)
+        try:
+            assert lookup.get(Path("/some/path/file.ttml")) == (None, None, None)
+        finally:
+            lookup.close()
+
+    def test_opens_read_only(self, tmp_path):
+        """Test the database is opened read-only."""
+        db_path = create_sample_db(tmp_path / "db.sqlite")
+        lookup = MetadataLookup(db_path)
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                lookup.conn.execute("DELETE FROM ZMTEPISODE")
+        finally:
+            lookup.close()
+
+    def test_missing_database_raises(self, tmp_path):
+        """Test a missing database is not created."""
+        with pytest.raises(sqlite3.OperationalError):
+            MetadataLookup(tmp_path / "missing.sqlite")
+        assert not (tmp_path / "missing.sqlite").exists()
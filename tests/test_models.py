@@ -5,7 +5,23 @@ from pathlib import Path
 
 import pytest
 
-from podcrack.models import Segment, Transcript
+from podcrack.models import Segment, Transcript, format_timestamp_hms
+
+
+class TestFormatTimestampHMS:
+    """Test timestamp formatting for display."""
+
+    def test_hours_minutes_seconds(self):
+        """Test milliseconds are dropped."""
+        assert format_timestamp_hms("01:23:45.678") == "01:23:45"
+
+    def test_without_hours(self):
+        """Test timestamps without hours are not formatted."""
+        assert format_timestamp_hms("23:45.678") == ""
+
+    def test_missing(self):
+        """Test missing timestamps."""
+        assert format_timestamp_hms(None) == ""
 
 
 class TestSegment:
@@ -32,6 +48,13 @@ class TestSegment:
         assert segment.end is None
         assert segment.speaker is None
 
+    def test_segment_has_no_instance_dict(self):
+        """Test segments are slotted to keep per-instance memory small."""
+        segment = Segment(text="Hello")
+        assert not hasattr(segment, "__dict__")
+        with pytest.raises(AttributeError):
+            segment.unknown = "value"
+
 
 class TestTranscript:
     """Test Transcript dataclass."""
@@ -57,6 +80,16 @@ class TestTranscript:
         transcript = Transcript(file_path=file_path, segments=segments)
         assert transcript.word_count == 6
 
+    def test_derived_text_is_cached(self):
+        """Test derived text properties are computed once and reused."""
+        file_path = Path("/test/file.ttml")
+        segments = [Segment(text="Hello", begin="00:00:01"), Segment(text="world")]
+        transcript = Transcript(file_path=file_path, segments=segments)
+        assert transcript.full_text is transcript.full_text
+        assert transcript.text_with_timestamps is transcript.text_with_timestamps
+        assert transcript.word_count == 2
+        assert transcript == Transcript(file_path=file_path, segments=segments)
+
     def test_duration_formatted(self):
         """Test duration_formatted property."""
         file_path = Path("/test/file.ttml")
@@ -114,6 +147,13 @@ class TestTranscript:
         assert "SPEAKER_1" in result
         assert "Hello" in result
 
+    def test_text_with_timestamps_precomputed(self):
+        """Test text_with_timestamps uses the precomputed begin_hms."""
+        file_path = Path("/test/file.ttml")
+        segments = [Segment(text="Hello", begin="00:00:01.500", begin_hms="00:00:01")]
+        transcript = Transcript(file_path=file_path, segments=segments)
+        assert transcript.text_with_timestamps == "[00:00:01] Hello"
+
     def test_metadata_fields(self):
         """Test metadata fields."""
         file_path = Path("/test/file.ttml")
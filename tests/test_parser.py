@@ -1,16 +1,26 @@
 """Tests for TTML parser."""
 
+import multiprocessing
+import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
 import pytest
 
+from podcrack import parser
 from podcrack.models import Segment, Transcript
 from podcrack.parser import (
     extract_text_from_element,
+    group_segments_into_paragraphs,
+    iter_segments,
+    parse_all,
     parse_timestamp,
     parse_ttml,
+    parse_ttml_cached,
 )
 
 
@@ -33,6 +43,16 @@ class TestParseTimestamp:
         """Test integer seconds."""
         assert parse_timestamp("60") == pytest.approx(60.0)
 
+    def test_fixed_width_matches_general_path(self):
+        """Test the HH:MM:SS.mmm fast path agrees with the general parser."""
+        assert parse_timestamp("00:00:00.000") == 0.0
+        assert parse_timestamp("10:59:59.999") == pytest.approx(parse_timestamp("10:59:59.9990"))
+
+    def test_invalid(self):
+        """Test invalid timestamps raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_timestamp("ab:cd:ef.ghi")
+
     def test_with_whitespace(self):
         """Test timestamp with whitespace."""
         assert parse_timestamp("  01:23:45.678  ") == pytest.approx(5025.678)
@@ -68,6 +88,16 @@ class TestExtractTextFromElement:
         assert "Hello" in result
         assert "world" in result
 
+    def test_nesting_deeper_than_recursion_limit(self):
+        """Test extraction does not recurse per nesting level."""
+        p = ET.Element("p")
+        elem = p
+        for _ in range(sys.getrecursionlimit() + 100):
+            elem = ET.SubElement(elem, "span")
+            elem.text = "w"
+        result = extract_text_from_element(p)
+        assert result.split() == ["w"] * (sys.getrecursionlimit() + 100)
+
     def test_with_tail_text(self):
         """Test element with tail text."""
         p = ET.Element("p")
@@ -88,6 +118,32 @@ class TestExtractTextFromElement:
         assert extract_text_from_element(elem) == "Hello world"
 
 
+class TestGroupSegmentsIntoParagraphs:
+    """Test grouping segments into paragraphs."""
+
+    def test_empty(self):
+        """Test no segments."""
+        assert group_segments_into_paragraphs([]) == []
+
+    def test_splits_on_gap(self):
+        """Test a gap above the threshold starts a new paragraph."""
+        segments = [
+            Segment(text="Hello", begin="00:00:00.000", end="00:00:01.000"),
+            Segment(text="world", begin="00:00:01.500", end="00:00:02.000"),
+            Segment(text="Again", begin="00:00:05.000", end="00:00:06.000"),
+        ]
+        assert group_segments_into_paragraphs(segments) == ["Hello world", "Again"]
+
+    def test_missing_or_invalid_timestamps(self):
+        """Test segments without usable timestamps stay in the current paragraph."""
+        segments = [
+            Segment(text="Hello", end="bad"),
+            Segment(text="big", begin="00:00:09.000"),
+            Segment(text="world", begin="00:00:20.000"),
+        ]
+        assert group_segments_into_paragraphs(segments) == ["Hello big world"]
+
+
 class TestParseTTML:
     """Test TTML file parsing."""
 
@@ -121,6 +177,7 @@ class TestParseTTML:
             assert transcript.segments[0].text == "Hello world"
             assert transcript.segments[0].begin == "0"
             assert transcript.segments[0].end == "5"
+            assert transcript.file_mtime == ttml_file.stat().st_mtime
         finally:
             ttml_file.unlink()
 
@@ -168,6 +225,17 @@ class TestParseTTML:
         finally:
             ttml_file.unlink()
 
+    def test_with_other_speaker_attribute(self):
+        """Test falling back to other speaker-like attributes."""
+        content = '<p begin="0" end="5" speaker="SPEAKER_2">Hello world</p>'
+        ttml_file = self.create_sample_ttml(content)
+
+        try:
+            transcript = parse_ttml(ttml_file)
+            assert transcript.segments[0].speaker == "SPEAKER_2"
+        finally:
+            ttml_file.unlink()
+
     def test_duration_calculation(self):
         """Test duration calculation from timestamps."""
         content = '<p begin="0" end="125.5">Test</p>'
@@ -209,8 +277,229 @@ class TestParseTTML:
         finally:
             ttml_file.unlink()
 
+    def test_without_namespace(self):
+        """Test parsing a TTML file without the TTML namespace."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.ttml', delete=False) as f:
+            f.write('<tt><body><div><p begin="0" end="5">Hello world</p></div></body></tt>')
+            ttml_file = Path(f.name)
+
+        try:
+            transcript = parse_ttml(ttml_file)
+            assert len(transcript.segments) == 1
+            assert transcript.segments[0].text == "Hello world"
+        finally:
+            ttml_file.unlink()
+
+    def test_iter_segments(self):
+        """Test streaming segments matches the parsed transcript."""
+        content = '<p begin="0" end="5">First</p><p begin="5" end="10"></p><p begin="10" end="15">Second</p>'
+        ttml_file = self.create_sample_ttml(content)
+
+        try:
+            streamed = iter_segments(ttml_file)
+            assert next(streamed).text == "First"
+            assert [s.text for s in streamed] == ["Second"]
+            assert list(iter_segments(ttml_file)) == parse_ttml(ttml_file).segments
+        finally:
+            ttml_file.unlink()
+
+    def test_stdlib_target_matches_default(self, monkeypatch):
+        """Test the lxml-free parser target yields the same segments across chunk boundaries."""
+        content = (
+            '<p begin="0" end="5" ttm:agent="A" xmlns:ttm="http://www.w3.org/ns/ttml#metadata">'
+            '<span>Hel</span>lo <span>big <span>wide</span></span>world</p>'
+            '<p begin="5" end="10"> </p><p begin="10" end="15">Second  line</p>'
+        )
+        ttml_file = self.create_sample_ttml(content)
+
+        try:
+            expected = list(iter_segments(ttml_file))
+            monkeypatch.setattr(parser, "lxml_etree", None)
+            monkeypatch.setattr(parser, "READ_CHUNK_SIZE", 7)
+            assert list(iter_segments(ttml_file)) == expected
+            assert [s.text for s in expected] == ["Hel lo big wide world", "Second line"]
+        finally:
+            ttml_file.unlink()
+
+    @pytest.mark.parametrize("use_lxml", [True, False])
+    def test_comments_and_pis_do_not_split_text(self, tmp_path, monkeypatch, use_lxml):
+        """Test text around comments and processing instructions joins up on both backends."""
+        if not use_lxml:
+            monkeypatch.setattr(parser, "lxml_etree", None)
+        ttml_file = tmp_path / "a.ttml"
+        ttml_file.write_text(
+            '<tt xmlns="http://www.w3.org/ns/ttml"><body><div>'
+            '<p begin="0" end="5">a<!--c-->b<?pi x?>c</p>'
+            '</div></body></tt>'
+        )
+        assert [s.text for s in iter_segments(ttml_file)] == ["abc"]
+
+    @pytest.mark.parametrize("use_lxml", [True, False])
+    def test_paragraphs_outside_body_ignored(self, tmp_path, monkeypatch, use_lxml):
+        """Test <p> elements in <head> metadata are not treated as segments."""
+        if not use_lxml:
+            monkeypatch.setattr(parser, "lxml_etree", None)
+        ttml_file = tmp_path / "a.ttml"
+        ttml_file.write_text(
+            '<tt xmlns="http://www.w3.org/ns/ttml">'
+            '<head><metadata><p>Not a segment</p></metadata></head>'
+            '<body><div><p begin="0" end="5">Hello world</p></div></body>'
+            '</tt>'
+        )
+        assert [s.text for s in iter_segments(ttml_file)] == ["Hello world"]
+
     def test_file_not_found(self):
         """Test error handling for missing file."""
         fake_path = Path("/nonexistent/file.ttml")
         with pytest.raises(FileNotFoundError):
             parse_ttml(fake_path)
+
+
+class TestParseAll:
+    """Test parsing many TTML files at once."""
+
+    @pytest.mark.parametrize("threshold, start_method", [(100, None), (0, None), (0, "spawn")])
+    def test_parse_all(self, tmp_path, monkeypatch, threshold, start_method):
+        """Test results keep input order and report bad files, in-process and in parallel."""
+        monkeypatch.setattr("podcrack.parser.PARALLEL_PARSE_THRESHOLD", threshold)
+        monkeypatch.setattr("podcrack.parser.CACHE_DIR", tmp_path / "cache")
+        # Exercise the worker pool even on single-core machines
+        monkeypatch.setattr("podcrack.parser.os.cpu_count", lambda: 2)
+        if start_method:
+            # Spawned workers re-import podcrack.parser; keep them away from the real cache
+            monkeypatch.setenv("HOME", str(tmp_path / "home"))
+            monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+            monkeypatch.setattr(
+                "podcrack.parser.ProcessPoolExecutor",
+                partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context(start_method)),
+            )
+        good = tmp_path / "good.ttml"
+        good.write_text(
+            '<tt xmlns="http://www.w3.org/ns/ttml"><body><div>'
+            '<p begin="0" end="5">Hello world</p>'
+            '</div></body></tt>'
+        )
+        bad = tmp_path / "bad.ttml"
+        bad.write_text("not xml")
+
+        results = list(parse_all([good, bad]))
+
+        assert [path for path, _, _ in results] == [good, bad]
+        assert results[0][1].full_text == "Hello world"
+        assert results[0][2] is None
+        assert results[1][1] is None
+        assert results[1][2]
+        assert any((tmp_path / "cache").rglob("*"))
+        assert not (tmp_path / "home").exists()
+
+    def write_files(self, tmp_path: Path, count: int) -> list:
+        """Write count minimal TTML files and return their paths."""
+        files = []
+        for i in range(count):
+            path = tmp_path / f"{i}.ttml"
+            path.write_text(
+                '<tt xmlns="http://www.w3.org/ns/ttml"><body><div>'
+                f'<p begin="0" end="5">Episode {i}</p>'
+                '</div></body></tt>'
+            )
+            files.append(path)
+        return files
+
+    def test_broken_pool_falls_back_in_process(self, tmp_path, monkeypatch):
+        """Test files left over when a worker dies are parsed in-process."""
+        monkeypatch.setattr("podcrack.parser.CACHE_DIR", tmp_path / "cache")
+        monkeypatch.setattr("podcrack.parser.PARALLEL_PARSE_THRESHOLD", 0)
+        monkeypatch.setattr("podcrack.parser.os.cpu_count", lambda: 4)
+        monkeypatch.setattr("podcrack.parser.ProcessPoolExecutor", _BrokenAfterFirstExecutor)
+        files = self.write_files(tmp_path, 3)
+
+        results = list(parse_all(files))
+
+        assert [t.full_text for _, t, _ in results] == ["Episode 0", "Episode 1", "Episode 2"]
+
+    def test_single_cpu_skips_workers(self, tmp_path, monkeypatch):
+        """Test no worker pool is started on a single-core machine."""
+        monkeypatch.setattr("podcrack.parser.CACHE_DIR", tmp_path / "cache")
+        monkeypatch.setattr("podcrack.parser.PARALLEL_PARSE_THRESHOLD", 0)
+        monkeypatch.setattr("podcrack.parser.os.cpu_count", lambda: 1)
+        monkeypatch.setattr("podcrack.parser.ProcessPoolExecutor", lambda *a, **k: pytest.fail("pool started"))
+        files = self.write_files(tmp_path, 2)
+
+        assert [t.full_text for _, t, _ in parse_all(files)] == ["Episode 0", "Episode 1"]
+
+    def test_warm_cache_skips_workers(self, tmp_path, monkeypatch):
+        """Test cached files are loaded in-process without starting a worker pool."""
+        monkeypatch.setattr("podcrack.parser.CACHE_DIR", tmp_path / "cache")
+        files = self.write_files(tmp_path, 3)
+        cold = list(parse_all(files))
+
+        monkeypatch.setattr("podcrack.parser.PARALLEL_PARSE_THRESHOLD", 0)
+        monkeypatch.setattr("podcrack.parser.ProcessPoolExecutor", lambda *a, **k: pytest.fail("pool started"))
+        monkeypatch.setattr("podcrack.parser.parse_ttml", lambda path: pytest.fail("re-parsed"))
+        warm = list(parse_all(files))
+
+        assert warm == cold
+        assert [t.full_text for _, t, _ in warm] == ["Episode 0", "Episode 1", "Episode 2"]
+
+
+class _BrokenAfterFirstExecutor:
+    """Stand-in process pool whose workers die after returning one result."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, *iterables, chunksize=1):
+        args = list(zip(*iterables))
+        yield fn(*args[0])
+        raise BrokenProcessPool("worker died")
+
+
+class TestParseTTMLCached:
+    """Test the on-disk parse cache."""
+
+    def write_ttml(self, path: Path, text: str) -> Path:
+        """Write a minimal TTML file with one paragraph."""
+        path.write_text(
+            '<tt xmlns="http://www.w3.org/ns/ttml"><body><div>'
+            f'<p begin="0" end="5">{text}</p>'
+            '</div></body></tt>'
+        )
+        return path
+
+    def test_cache_hit(self, tmp_path, monkeypatch):
+        """Test an unchanged file is served from the cache."""
+        monkeypatch.setattr("podcrack.parser.CACHE_DIR", tmp_path / "cache")
+        ttml_file = self.write_ttml(tmp_path / "a.ttml", "Hello world")
+
+        first = parse_ttml_cached(ttml_file)
+        assert any((tmp_path / "cache").rglob("*"))
+
+        monkeypatch.setattr("podcrack.parser.parse_ttml", lambda path: pytest.fail("re-parsed"))
+        second = parse_ttml_cached(ttml_file)
+        assert second == first
+
+    def test_cache_invalidated_on_change(self, tmp_path, monkeypatch):
+        """Test a modified file is re-parsed."""
+        monkeypatch.setattr("podcrack.parser.CACHE_DIR", tmp_path / "cache")
+        ttml_file = self.write_ttml(tmp_path / "a.ttml", "Hello world")
+        assert parse_ttml_cached(ttml_file).full_text == "Hello world"
+
+        self.write_ttml(ttml_file, "Something else entirely")
+        assert parse_ttml_cached(ttml_file).full_text == "Something else entirely"
+
+    def test_corrupt_cache_entry(self, tmp_path, monkeypatch):
+        """Test unreadable cache entries fall back to parsing."""
+        monkeypatch.setattr("podcrack.parser.CACHE_DIR", tmp_path / "cache")
+        ttml_file = self.write_ttml(tmp_path / "a.ttml", "Hello world")
+        parse_ttml_cached(ttml_file)
+        for entry in (tmp_path / "cache").rglob("*"):
+            if entry.is_file():
+                entry.write_bytes(b"garbage")
+
+        assert parse_ttml_cached(ttml_file).full_text == "Hello world"
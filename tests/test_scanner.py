@@ -1,105 +1,125 @@
 """Tests for file scanner."""
 
-import tempfile
+import os
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
+from podcrack import scanner
 from podcrack.scanner import check_sqlite_db_exists, scan_ttml_files
 
 
+def _mk(ttml_dir: Path, *names: str) -> None:
+    """Create empty files (and any parent directories) under ttml_dir."""
+    for name in names:
+        path = os.path.join(ttml_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644))
+
+
+@pytest.fixture(scope="module")
+def ttml_tree(tmp_path_factory):
+    """Build a TTML directory once per module, with distinct deterministic mtimes."""
+    ttml_dir = tmp_path_factory.mktemp("TTML")
+    files = ["subdir/test.ttml", "test1.ttml", "test2.ttml", "not_ttml.txt"]
+    _mk(ttml_dir, *files)
+    for mtime, name in enumerate(files, start=1):
+        os.utime(ttml_dir / name, (mtime * 1_000_000_000, mtime * 1_000_000_000))
+    return ttml_dir
+
+
 class TestScanTTMLFiles:
     """Test TTML file scanning."""
 
-    def test_scan_ttml_files_not_found(self):
+    def test_scan_ttml_files_not_found(self, monkeypatch):
         """Test error when TTML directory doesn't exist."""
-        with patch('podcrack.scanner.TTML_DIR', Path("/nonexistent/dir")):
-            with pytest.raises(FileNotFoundError):
-                scan_ttml_files()
-
-    def test_scan_ttml_files_empty_directory(self):
-        """Test scanning empty directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            ttml_dir = Path(tmpdir) / "TTML"
-            ttml_dir.mkdir()
-            
-            with patch('podcrack.scanner.TTML_DIR', ttml_dir):
-                files = scan_ttml_files()
-                assert len(files) == 0
-
-    def test_scan_ttml_files_finds_files(self):
-        """Test finding TTML files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            ttml_dir = Path(tmpdir) / "TTML"
-            ttml_dir.mkdir()
-            
-            # Create test TTML files
-            (ttml_dir / "test1.ttml").write_text("test")
-            (ttml_dir / "test2.ttml").write_text("test")
-            (ttml_dir / "not_ttml.txt").write_text("test")
-            
-            with patch('podcrack.scanner.TTML_DIR', ttml_dir):
-                files = scan_ttml_files()
-                assert len(files) == 2
-                assert all(f.suffix == ".ttml" for f in files)
-
-    def test_scan_ttml_files_recursive(self):
-        """Test recursive scanning in subdirectories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            ttml_dir = Path(tmpdir) / "TTML"
-            ttml_dir.mkdir()
-            subdir = ttml_dir / "subdir"
-            subdir.mkdir()
-            
-            # Create files in subdirectory
-            (subdir / "test.ttml").write_text("test")
-            
-            with patch('podcrack.scanner.TTML_DIR', ttml_dir):
-                files = scan_ttml_files()
-                assert len(files) == 1
-                assert "subdir" in str(files[0])
-
-    def test_scan_ttml_files_sorted_by_mtime(self):
+        monkeypatch.setattr(scanner, 'TTML_DIR', Path("/nonexistent/dir"))
+        with pytest.raises(FileNotFoundError):
+            scan_ttml_files()
+
+    def test_scan_ttml_files_not_a_directory(self, tmp_path, monkeypatch):
+        """Test error when TTML path is a file."""
+        _mk(tmp_path, "TTML")
+        ttml_file = tmp_path / "TTML"
+        monkeypatch.setattr(scanner, 'TTML_DIR', ttml_file)
+        with pytest.raises(NotADirectoryError):
+            scan_ttml_files()
+
+    @pytest.mark.parametrize("tree_spec, expected_count", [
+        ((), 0),
+        (("test1.ttml", "test2.ttml", "not_ttml.txt"), 2),
+        (("subdir/test.ttml",), 1),
+    ])
+    def test_scan_counts(self, tmp_path, monkeypatch, tree_spec, expected_count):
+        """Test scanning finds only .ttml files, including in subdirectories."""
+        _mk(tmp_path, *tree_spec)
+        monkeypatch.setattr(scanner, 'TTML_DIR', tmp_path)
+        files = scan_ttml_files()
+        assert len(files) == expected_count
+        assert all(f.suffix == ".ttml" for f in files)
+
+    def test_scan_ttml_files_skips_symlinked_dirs(self, tmp_path, monkeypatch):
+        """Test symlinked directories are not followed."""
+        ttml_dir = tmp_path / "TTML"
+        _mk(tmp_path, "outside/linked.ttml", "TTML/test.ttml")
+        (ttml_dir / "link").symlink_to(tmp_path / "outside", target_is_directory=True)
+
+        monkeypatch.setattr(scanner, 'TTML_DIR', ttml_dir)
+        files = scan_ttml_files()
+        assert [f.name for f in files] == ["test.ttml"]
+        assert files[0] == ttml_dir / "test.ttml"
+
+    def test_scan_ttml_files_symlinked_root(self, tmp_path, monkeypatch):
+        """Test a TTML directory that is itself a symlink is walked."""
+        _mk(tmp_path, "real/test.ttml", "real/subdir/nested.ttml")
+        link = tmp_path / "link"
+        link.symlink_to(tmp_path / "real", target_is_directory=True)
+
+        monkeypatch.setattr(scanner, 'TTML_DIR', link)
+        files = scan_ttml_files()
+        assert sorted(files) == [link / "subdir" / "nested.ttml", link / "test.ttml"]
+
+    def test_scan_ttml_files_symlinked_empty_root(self, tmp_path, monkeypatch):
+        """Test an empty symlinked TTML directory scans to an empty list."""
+        (tmp_path / "real").mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(tmp_path / "real", target_is_directory=True)
+
+        monkeypatch.setattr(scanner, 'TTML_DIR', link)
+        assert scan_ttml_files() == []
+
+    def test_scan_ttml_files_skips_dangling_symlinks(self, tmp_path, monkeypatch):
+        """Test a .ttml symlink to a missing file is ignored."""
+        _mk(tmp_path, "test.ttml")
+        (tmp_path / "gone.ttml").symlink_to(tmp_path / "missing.ttml")
+
+        monkeypatch.setattr(scanner, 'TTML_DIR', tmp_path)
+        assert scan_ttml_files() == [tmp_path / "test.ttml"]
+
+    def test_scan_ttml_files_sorted_by_mtime(self, ttml_tree, monkeypatch):
         """Test files are sorted by modification time."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            ttml_dir = Path(tmpdir) / "TTML"
-            ttml_dir.mkdir()
-            
-            file1 = ttml_dir / "old.ttml"
-            file2 = ttml_dir / "new.ttml"
-            
-            file1.write_text("old")
-            file2.write_text("new")
-            
-            # Make file2 newer
-            import time
-            time.sleep(0.1)
-            file2.touch()
-            
-            with patch('podcrack.scanner.TTML_DIR', ttml_dir):
-                files = scan_ttml_files()
-                # Newest first
-                assert files[0].name == "new.ttml"
-                assert files[1].name == "old.ttml"
+        monkeypatch.setattr(scanner, 'TTML_DIR', ttml_tree)
+        files = scan_ttml_files()
+        # Newest first
+        assert [f.name for f in files] == ["test2.ttml", "test1.ttml", "test.ttml"]
 
 
 class TestCheckSQLiteDBExists:
     """Test SQLite database existence check."""
 
-    def test_check_sqlite_db_exists_true(self):
+    def test_check_sqlite_db_exists_true(self, tmp_path, monkeypatch):
         """Test when database exists."""
-        with tempfile.NamedTemporaryFile(suffix='.sqlite', delete=False) as f:
-            db_path = Path(f.name)
-        
-        try:
-            with patch('podcrack.scanner.SQLITE_DB', db_path):
-                assert check_sqlite_db_exists() is True
-        finally:
-            db_path.unlink()
-
-    def test_check_sqlite_db_exists_false(self):
+        db_path = tmp_path / "MTLibrary.sqlite"
+        db_path.touch()
+        monkeypatch.setattr(scanner, 'SQLITE_DB', db_path)
+        assert check_sqlite_db_exists() is True
+
+    def test_check_sqlite_db_exists_directory(self, tmp_path, monkeypatch):
+        """Test a directory at the database path doesn't count."""
+        monkeypatch.setattr(scanner, 'SQLITE_DB', tmp_path)
+        assert check_sqlite_db_exists() is False
+
+    def test_check_sqlite_db_exists_false(self, monkeypatch):
         """Test when database doesn't exist."""
-        fake_path = Path("/nonexistent/db.sqlite")
-        with patch('podcrack.scanner.SQLITE_DB', fake_path):
-            assert check_sqlite_db_exists() is False
+        monkeypatch.setattr(scanner, 'SQLITE_DB', Path("/nonexistent/db.sqlite"))
+        assert check_sqlite_db_exists() is False